@@ -0,0 +1,27 @@
+# Generated by Django 4.2.13 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jasmin_manage", "0029_project_fairshare"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="requirement",
+            index=models.Index(
+                fields=["resource", "status"],
+                name="req_resource_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="requirement",
+            index=models.Index(
+                fields=["service", "status"],
+                name="req_service_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.13 on 2026-10-16 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jasmin_manage", "0030_requirement_status_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="requirement",
+            index=models.Index(
+                condition=models.Q(("status__in", [40, 50])),
+                fields=["status", "service"],
+                name="req_active_partial_idx",
+            ),
+        ),
+    ]
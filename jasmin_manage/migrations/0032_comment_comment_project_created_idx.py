@@ -0,0 +1,19 @@
+# Generated by Django 4.2.13 on 2026-10-16 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jasmin_manage", "0031_requirement_req_active_partial_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["project", "-created_at"], name="comment_project_created_idx"
+            ),
+        ),
+    ]
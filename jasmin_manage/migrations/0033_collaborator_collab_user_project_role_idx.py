@@ -0,0 +1,19 @@
+# Generated by Django 4.2.13 on 2026-10-16 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("jasmin_manage", "0032_comment_comment_project_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="collaborator",
+            index=models.Index(
+                fields=["user", "project", "role"], name="collab_user_project_role_idx"
+            ),
+        ),
+    ]
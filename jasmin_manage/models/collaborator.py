@@ -12,6 +12,13 @@ class Collaborator(models.Model):
     class Meta:
         ordering = ("project__name", "role", "user__username")
         unique_together = ("project", "user")
+        # Permission checks look up the role of a user in a project, or find the projects
+        # a user collaborates on, so both can be answered from this index
+        indexes = [
+            models.Index(
+                fields=["user", "project", "role"], name="collab_user_project_role_idx"
+            ),
+        ]
 
     class Role(models.IntegerChoices):
         """
@@ -11,6 +11,12 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ("project__name", "-created_at")
+        # Allows the latest comments for a project to be read from the index
+        indexes = [
+            models.Index(
+                fields=["project", "-created_at"], name="comment_project_created_idx"
+            ),
+        ]
 
     project = models.ForeignKey(
         Project, models.CASCADE, related_name="comments", related_query_name="comment"
@@ -31,11 +31,11 @@ class QuotaQuerySet(models.QuerySet):
                 (
                     (
                         "{}_count".format(status.name.lower()),
-                        models.Count("status", filter=models.Q(status=status)),
+                        models.Count("status", filter=models.Q(status=status.value)),
                     ),
                     (
                         "{}_total".format(status.name.lower()),
-                        models.Sum("amount", filter=models.Q(status=status)),
+                        models.Sum("amount", filter=models.Q(status=status.value)),
                     ),
                 )
                 # If no statuses are given, use them all
@@ -23,6 +23,18 @@ class Requirement(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        # Usage aggregations filter by resource or service and status together
+        indexes = [
+            models.Index(fields=["resource", "status"], name="req_resource_status_idx"),
+            models.Index(fields=["service", "status"], name="req_service_status_idx"),
+            # Small partial index for the awaiting provisioning (40) and provisioned (50)
+            # requirements, which are looked up by status for notifications and summaries
+            models.Index(
+                fields=["status", "service"],
+                condition=models.Q(status__in=[40, 50]),
+                name="req_active_partial_idx",
+            ),
+        ]
 
     # The statuses are ordered, as they represent a progression
     # So use integers for them as it allows some queries to be more efficient
@@ -34,6 +46,9 @@ class Requirement(models.Model):
         PROVISIONED = 50
         DECOMMISSIONED = 60
 
+    # Lower-cased status names, indexed by value, for building event types
+    _STATUS_EVENT_NAMES = {status.value: status.name.lower() for status in Status}
+
     service = models.ForeignKey(
         Service,
         models.CASCADE,
@@ -65,7 +80,7 @@ class Requirement(models.Model):
         # If the status is in the diff, use it as the event type, otherwise use the default
         if "status" in diff:
             return "{}.{}".format(
-                self._meta.label_lower, self.Status(diff["status"]).name.lower()
+                self._meta.label_lower, self._STATUS_EVENT_NAMES[diff["status"]]
             )
 
     def clean(self):
@@ -74,12 +89,13 @@ class Requirement(models.Model):
         if self.service_id and self.resource_id:
             # For new requirements, the selected resource must belong to the category of the service
             # For existing requirements, it is also allowed to be the current resource
-            allowed_resources = self.service.category.resources.all()
+            # Combine the conditions in a single query rather than a union of two querysets
+            allowed_resources = models.Q(category=self.service.category_id)
             if not self._state.adding:
-                allowed_resources = allowed_resources | Resource.objects.filter(
-                    requirement=self
-                )
-            if not allowed_resources.filter(pk=self.resource.pk).exists():
+                allowed_resources |= models.Q(requirement=self)
+            if not Resource.objects.filter(
+                allowed_resources, pk=self.resource_id
+            ).exists():
                 errors.setdefault("resource", []).append(
                     "Resource is not valid for the selected service."
                 )
@@ -58,11 +58,11 @@ class ResourceQuerySet(models.QuerySet):
                 (
                     (
                         "{}_count".format(status.name.lower()),
-                        models.Count("status", filter=models.Q(status=status)),
+                        models.Count("status", filter=models.Q(status=status.value)),
                     ),
                     (
                         "{}_total".format(status.name.lower()),
-                        models.Sum("amount", filter=models.Q(status=status)),
+                        models.Sum("amount", filter=models.Q(status=status.value)),
                     ),
                 )
                 for status in Requirement.Status
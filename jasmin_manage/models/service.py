@@ -39,6 +39,8 @@ class Service(models.Model):
         # 20 characters is long enough for a service name
         max_length=30,
         # Index the field for faster searches
+        # The unique_together index on (category, name) cannot serve lookups by name
+        # alone, which the service list endpoint performs via the name query parameter
         db_index=True,
         # Use a regex to validate the field
         validators=[
@@ -59,9 +61,18 @@ class Service(models.Model):
     def natural_key(self):
         return self.category.name, self.name
 
-    def get_num_active_requirements(self):
-        # Checks whether there are any active reqs. if so returns True, else False
-        return self.requirements.filter(status=50).count()
+    def get_parent_consortium(self):
+        # The consortium id is stored on the project, so there is no need to fetch the consortium
+        return self.project.consortium_id
+
+    def has_active_requirements(self):
+        # Checks whether there are any provisioned requirements for the service
+        if hasattr(self, "num_active_requirements"):
+            # Use the value from the object if present (e.g. from an annotation)
+            return self.num_active_requirements > 0
+        from .requirement import Requirement
+
+        return self.requirements.filter(status=Requirement.Status.PROVISIONED).exists()
 
     natural_key.dependencies = (Category._meta.label_lower,)
 
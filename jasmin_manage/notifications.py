@@ -1,14 +1,44 @@
-import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from tsunami.helpers import model_event_listener
 from tsunami_notify.models import Notification
 
 from .models import Collaborator, Comment, Invitation, Project, Requirement
 
 
+logger = logging.getLogger(__name__)
+
+
+# Slack messages are posted by a single background worker, so that a burst of
+# notifications is queued rather than starting a thread for each one
+# The worker is joined when the interpreter exits, so queued messages are still sent
+slack_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slack")
+
+
+def notify_collaborators(event, collaborators):
+    """
+    Notify each of the given collaborators of the event.
+    """
+    # It is possible that the user may not have an email address defined yet
+    # Only the role and the user's email are needed to create the notifications
+    # The project must also be loaded, as querysets from a related manager attach the
+    # known project to each collaborator using it
+    collaborators = collaborators.exclude(user__email="").only(
+        "project", "role", "user__email"
+    )
+    for collaborator in collaborators:
+        Notification.create(
+            event,
+            collaborator.user.email,
+            dict(project_role=Collaborator.Role(collaborator.role).name),
+        )
+
+
 @model_event_listener(
     Project,
     [
@@ -26,14 +56,7 @@ def notify_project_collaborators_project_event(event):
     collaborators = event.target.collaborators.select_related("user")
     if event.user:
         collaborators = collaborators.exclude(user=event.user)
-    for collaborator in collaborators:
-        # It is possible that the user may not have an email address defined yet
-        if collaborator.user.email:
-            Notification.create(
-                event,
-                collaborator.user.email,
-                dict(project_role=Collaborator.Role(collaborator.role).name),
-            )
+    notify_collaborators(event, collaborators)
 
 
 @model_event_listener(Project, ["submitted_for_review"])
@@ -41,7 +64,11 @@ def notify_consortium_manager_project_submitted_for_review(event):
     """
     Notify the consortium manager when a project is submitted for review.
     """
-    consortium_manager = event.target.consortium.manager
+    # Fetch the manager directly using the consortium id on the project, rather than
+    # loading the consortium and then the manager in separate queries
+    consortium_manager = get_user_model().objects.get(
+        consortium=event.target.consortium_id
+    )
     # If the consortium manager is also the project owner who is submitting
     # the project for review, don't bother sending the notificion
     if event.user and event.user != consortium_manager and consortium_manager.email:
@@ -50,78 +77,110 @@ def notify_consortium_manager_project_submitted_for_review(event):
         )
 
 
+def post_slack_message(webhook_url, message):
+    """
+    Post the given message to the given slack webhook, logging any errors.
+    """
+    # This runs on the slack executor, where nothing waits for the result, so any
+    # error must be logged here or it is lost
+    try:
+        response = requests.post(webhook_url, json=message, timeout=5)
+    except Exception:
+        logger.exception("Request to slack failed")
+        return
+    if response.status_code != 200:
+        logger.error(
+            "Request to slack returned an error %s, the response is:\n%s",
+            response.status_code,
+            response.text,
+        )
+
+
 @model_event_listener(Project, ["submitted_for_provisioning"])
 def notify_slack_project_submitted_for_provisioning(event):
     """
     Notify staff via slack channel when a project is submitted for provisioning.
+
+    Delivery is best-effort. The message is posted in the background once the
+    transaction commits, and a failure to post it is logged rather than retried.
     """
-    # Only send a notification if a webhook is given
-    if settings.SLACK_NOTIFICATIONS["WEBHOOK_URL"]:
-        # Get the comments on the project
-        comments = Comment.objects.filter(project=event.target.id).select_related(
-            "project"
+    # Read the slack settings once, and only send a notification if a webhook is given
+    slack_settings = settings.SLACK_NOTIFICATIONS
+    webhook_url = slack_settings["WEBHOOK_URL"]
+    if not webhook_url:
+        return
+    # Get the most recent comment on the project
+    comment = (
+        Comment.objects.filter(project=event.target.id)
+        .order_by("-created_at")
+        .only("content", "created_at")
+        .first()
+    )
+    if comment:
+        comment_str = ">*Comment:*\n>*{}* ' _{}_ '".format(
+            comment.created_at.strftime("%d %b %y %H:%M"), comment.content
         )
-        # Get the requirements associated with the project
-        requirements = (
-            # Requirements with status=40 are 'awaiting provisioning'
-            Requirement.objects.filter(
-                status="40", service__project=event.target.id
-            ).order_by("service_id")
+    else:
+        comment_str = ">*Comment:*\n>_No comment given._"
+    # Get the requirements associated with the project
+    requirements = (
+        # Requirements with status=40 are 'awaiting provisioning'
+        Requirement.objects.filter(status="40", service__project=event.target.id)
+        .order_by("service_id")
+        # Only the fields used in the message are fetched, in a single joined query
+        .values(
+            "service_id",
+            "service__name",
+            "resource__name",
+            "resource__units",
+            "amount",
         )
-        # For each requirement add the service, resource and amount requested to the string
-        service_str = ""
-        for j in requirements:
-            if j.resource.units:
-                service_str = f'service_str\n *Service:      * <{settings.SLACK_NOTIFICATIONS["SERVICE_REQUEST_URL"]}{str(j.service.id)}|{j.service.name}>\n*Resource:  * {j.resource.name}\n *Amount:    *{str(j.amount)}{j.resource.units}\n'
-            else:
-                service_str = f'service_str\n *Service:      * <{settings.SLACK_NOTIFICATIONS["SERVICE_REQUEST_URL"]}{str(j.service.id)}|{j.service.name}>\n*Resource:  * {j.resource.name}\n *Amount:    *{str(j.amount)}\n'
-
-        # Compose the message using slack blocks
-        message = {
-            "text": "New requirement[s] submitted for provisioning.",
-            "blocks": [
-                {
-                    "type": "header",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "New requirement[s] submitted for provisioning for the '"
-                        + event.target.name
-                        + "' project in the '"
-                        + str(event.target.consortium)
-                        + "' consortium.",
-                    },
-                },
-                {
-                    "type": "section",
-                    "fields": [
-                        {
-                            "type": "mrkdwn",
-                            "text": ">*Comment:*\n>*"
-                            + comments[0].created_at.strftime("%d %b %y %H:%M")
-                            + "* ' _"
-                            + comments[0].content
-                            + "_ '",
-                        }
-                    ],
-                },
-                {
-                    "type": "section",
-                    "fields": [
-                        {"type": "mrkdwn", "text": service_str},
-                    ],
-                },
-            ],
-        }
-        print(json.dumps(message))
-        # Send the message
-        response = requests.post(
-            settings.SLACK_NOTIFICATIONS["WEBHOOK_URL"], json.dumps(message)
+    )
+    # For each requirement add the service, resource and amount requested to the string
+    service_request_url = slack_settings["SERVICE_REQUEST_URL"]
+    service_parts = []
+    for j in requirements:
+        service_parts.append(
+            f"\n *Service:      * <{service_request_url}{j['service_id']}|{j['service__name']}>"
+            f"\n*Resource:  * {j['resource__name']}"
+            f"\n *Amount:    *{j['amount']}{j['resource__units'] or ''}\n"
         )
-        if response.status_code != 200:
-            raise ValueError(
-                "Request to slack returned an error %s, the response is:\n%s"
-                % (response.status_code, response.text)
-            )
+    service_str = "".join(service_parts)
+
+    # Compose the message using slack blocks
+    message = {
+        "text": "New requirement[s] submitted for provisioning.",
+        "blocks": [
+            {
+                "type": "header",
+                "text": {
+                    "type": "plain_text",
+                    "text": "New requirement[s] submitted for provisioning for the '"
+                    + event.target.name
+                    + "' project in the '"
+                    + str(event.target.consortium)
+                    + "' consortium.",
+                },
+            },
+            {
+                "type": "section",
+                "fields": [
+                    {"type": "mrkdwn", "text": comment_str},
+                ],
+            },
+            {
+                "type": "section",
+                "fields": [
+                    {"type": "mrkdwn", "text": service_str},
+                ],
+            },
+        ],
+    }
+    # Send the message in the background once the transaction has committed, so
+    # that a slow response from slack does not hold up the request
+    transaction.on_commit(
+        lambda: slack_executor.submit(post_slack_message, webhook_url, message)
+    )
 
 
 @model_event_listener(Requirement, ["provisioned"])
@@ -129,17 +188,11 @@ def notify_project_collaborators_requirement_provisioned(event):
     """
     Notify the project collaborators when a requirement is provisioned.
     """
+    # Filter on the project id directly rather than joining through services and requirements
     collaborators = Collaborator.objects.filter(
-        project__service__requirement=event.target
+        project_id=event.target.service.project_id
     ).select_related("user")
-    for collaborator in collaborators:
-        # It is possible that the user may not have an email address defined yet
-        if collaborator.user.email:
-            Notification.create(
-                event,
-                collaborator.user.email,
-                dict(project_role=Collaborator.Role(collaborator.role).name),
-            )
+    notify_collaborators(event, collaborators)
 
 
 @model_event_listener(Collaborator, ["created"])
@@ -150,14 +203,7 @@ def notify_project_collaborators_new_collaborator(event):
     collaborators = event.target.project.collaborators.select_related("user")
     if event.user:
         collaborators = collaborators.exclude(user=event.user)
-    for collaborator in collaborators:
-        # It is possible that the user may not have an email address defined yet
-        if collaborator.user.email:
-            Notification.create(
-                event,
-                collaborator.user.email,
-                dict(project_role=Collaborator.Role(collaborator.role).name),
-            )
+    notify_collaborators(event, collaborators)
 
 
 @model_event_listener(Collaborator, ["deleted"])
@@ -167,14 +213,16 @@ def notify_project_collaborator_removed(event):
     """
     # The collaborator record, i.e. event.target, will no longer exist
     # But the last known state is recorded in the event data, so we can get the user from that
-    user = get_user_model().objects.filter(pk=event.data["user"]).first()
+    user = get_user_model().objects.only("email").filter(pk=event.data["user"]).first()
     # If we found a user and they have an email set, notify them, unless they
     # removed themselves
     if user and user.email and user != event.user:
         # Get the project from the event data and store the project name in the context,
         # since we can't access it in the template using target.project.name
-        project = Project.objects.get(pk=event.data["project"])
-        Notification.create(event, user.email, dict(project_name=project.name))
+        project_name = Project.objects.values_list("name", flat=True).get(
+            pk=event.data["project"]
+        )
+        Notification.create(event, user.email, dict(project_name=project_name))
 
 
 @model_event_listener(Invitation, ["created"])
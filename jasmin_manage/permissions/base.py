@@ -4,17 +4,55 @@ from rest_framework.permissions import SAFE_METHODS, IsAuthenticated
 from ..models import Collaborator
 
 
+def get_request_cache(request):
+    """
+    Returns a dictionary that can be used to cache permission lookups for the
+    lifetime of the given request.
+    """
+    try:
+        return request._permissions_cache
+    except AttributeError:
+        request._permissions_cache = {}
+        return request._permissions_cache
+
+
 class BaseProjectPermissions(IsAuthenticated):
     """
     Base class for DRF permissions classes for project resources.
     """
 
+    def __init__(self):
+        super().__init__()
+        # Cache of permission lookups
+        # This is replaced with the cache for the request when a request is checked,
+        # so that it is shared between the permission and object permission checks
+        self._cache = {}
+
+    def get_collaborator_role(self, project, user):
+        """
+        Returns the role of the user in the project, or None if the user is not a
+        collaborator.
+
+        The role is cached, so checking several conditions for the same project and
+        user during a request only issues a single query.
+        """
+        key = ("collaborator_role", project.pk, user.pk)
+        if key not in self._cache:
+            # Clear the default ordering, which joins the project and user tables
+            self._cache[key] = (
+                project.collaborators.filter(user=user)
+                .order_by()
+                .values_list("role", flat=True)
+                .first()
+            )
+        return self._cache[key]
+
     def is_project_collaborator(self, project, user):
         """
         Returns true if the user is a collaborator for the project.
         """
         try:
-            return project.collaborators.filter(user=user).exists()
+            return self.get_collaborator_role(project, user) is not None
         except AttributeError:
             return None
 
@@ -22,18 +60,16 @@ class BaseProjectPermissions(IsAuthenticated):
         """
         Returns true if the user is an owner for the project.
         """
-        return project.collaborators.filter(
-            user=user, role=Collaborator.Role.OWNER
-        ).exists()
+        return self.get_collaborator_role(project, user) == Collaborator.Role.OWNER
 
     def is_consortium_manager(self, project, user):
         """
         Returns true if the user is the consortium manager for the project.
         """
+        # Compare the ids to avoid fetching the manager
         try:
-            return project.consortium.manager == user
-        except AttributeError as e:
-            print(e)
+            return project.consortium.manager_id == user.pk
+        except AttributeError:
             return None
 
     def get_project_from_viewset(self, viewset):
@@ -101,6 +137,7 @@ class BaseProjectPermissions(IsAuthenticated):
             raise Http404
 
     def has_permission(self, request, view):
+        self._cache = get_request_cache(request)
         # If the parent check fails, we are done (the user is not logged in.)
         if not super().has_permission(request, view):
             return False
@@ -113,6 +150,7 @@ class BaseProjectPermissions(IsAuthenticated):
         return self._has_permission_or_404(request, view, project)
 
     def has_object_permission(self, request, view, obj):
+        self._cache = get_request_cache(request)
         # Get the project from the object
         project = self.get_project_from_object(obj)
         # Use the project to determine the permissions
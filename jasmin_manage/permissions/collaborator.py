@@ -1,5 +1,3 @@
-from rest_framework.permissions import IsAuthenticated
-
 from .base import BaseProjectPermissions
 
 
@@ -20,9 +18,10 @@ class CollaboratorPermissions(BaseProjectPermissions):
         # Collaborators cannot be created directly
         if action in {"list", "retrieve"}:
             return (
-                self.is_consortium_manager(project, user)
+                # Check staff first as it doesn't require a query
+                user.is_staff
+                or self.is_consortium_manager(project, user)
                 or self.is_project_collaborator(project, user)
-                or user.is_staff
             )
         elif action in {"update", "partial_update", "destroy"}:
             return self.is_project_owner(project, user)
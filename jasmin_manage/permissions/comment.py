@@ -1,5 +1,3 @@
-from rest_framework.permissions import IsAuthenticated
-
 from .base import BaseProjectPermissions
 
 
@@ -18,19 +16,21 @@ class CommentPermissions(BaseProjectPermissions):
         if action in {"list", "retrieve", "create"}:
             # Comments can be viewed and created by:
             return (
+                # Staff, checked first as it doesn't require a query
+                user.is_staff
+                or
                 # Consortium managers
                 self.is_consortium_manager(project, user)
                 or
                 # Project collaborators
                 self.is_project_collaborator(project, user)
-                or user.is_staff
             )
         elif action in {"update", "partial_update", "destroy"}:
             # Project owners can update or delete any comments
             if self.is_project_owner(project, user):
                 return True
             # Other users can only update their own comments
-            if obj.user != user:
+            if obj.user_id != user.pk:
                 return False
             # But only if they are still associated with the project, either
             # as a manager or a contributor
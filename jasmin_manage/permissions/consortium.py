@@ -1,52 +1,56 @@
 from django.http import Http404
 
-from rest_framework.permissions import IsAuthenticated, SAFE_METHODS
+from rest_framework.permissions import IsAuthenticated
 
-from ..models import Consortium
+from ..models import Collaborator, Consortium
+from .base import get_request_cache
 
 
-def user_can_view_consortium(user, consortium):
+def user_is_consortium_collaborator(user, consortium, cache=None):
+    """
+    Returns true if the user is a collaborator on a project in the consortium.
+
+    If a cache is given, the result is stored in it so that it is only queried once.
+    """
+    if cache is None:
+        cache = {}
+    key = ("consortium_collaborator", consortium.pk, user.pk)
+    if key not in cache:
+        # Start from the user's collaborator records, which are indexed by user
+        cache[key] = Collaborator.objects.filter(
+            user=user, project__consortium=consortium.pk
+        ).exists()
+    return cache[key]
+
+
+def user_can_view_consortium(user, consortium, cache=None):
     """
     Returns true if the user can view the consortium, false otherwise.
     """
-    if consortium.is_public:
+    # The membership query only runs if none of the cheaper checks pass
+    return (
         # All users can view public consortia
-        return True
-    elif user.is_staff:
+        consortium.is_public
         # Staff users can view all consortia
-        return True
-    elif consortium.manager == user:
+        or user.is_staff
         # Managers can view their own consortia
-        return True
-    else:
+        or consortium.manager_id == user.pk
         # Non-staff users can view a non-public consortium if they belong
         # to a project in the consortium
-        return consortium.projects.filter(collaborator__user=user).exists()
+        or user_is_consortium_collaborator(user, consortium, cache)
+    )
 
 
-def user_can_view_quota(user, consortium):
+def user_can_view_quota(user, consortium, cache=None):
     """
     Returns true if the user can view the nested quota, false otherwise.
     """
-    # Consortium managers can view the quotas
-    if consortium.manager == user:
-        return True
-
-    # Project collaborators and owners can view the quotas
-    elif consortium.projects.filter(collaborator__user=user).exists():
-        return True
-    # Nobody else can see the quotas
-    else:
-        return False
-
-
-def user_is_staff(user):
-    """Returns true if the user is marked as staff, false otherwise."""
-    # We want staff to be able to see quotas
-    if user.is_staff:
-        return True
-    else:
-        return False
+    return (
+        # Consortium managers can view the quotas
+        consortium.manager_id == user.pk
+        # Project collaborators and owners can view the quotas
+        or user_is_consortium_collaborator(user, consortium, cache)
+    )
 
 
 class ConsortiumPermissions(IsAuthenticated):
@@ -58,7 +62,8 @@ class ConsortiumPermissions(IsAuthenticated):
         if not super().has_object_permission(request, view, obj):
             return False
         # Always raise a 404 on failure in order to hide information about valid consortia
-        if user_can_view_consortium(request.user, obj):
+        cache = get_request_cache(request)
+        if user_can_view_consortium(request.user, obj, cache):
             return True
         else:
             raise Http404
@@ -74,16 +79,18 @@ class ConsortiumNestedViewSetPermissions(IsAuthenticated):
         if not super().has_permission(request, view):
             return False
         # Get the consortium using the key from the viewset
+        # Only the visibility and manager id are needed to check permissions
         consortium = (
-            Consortium.objects.prefetch_related("manager")
+            Consortium.objects.only("is_public", "manager")
             .filter(pk=view.kwargs["consortium_pk"])
             .first()
         )
-        if consortium and user_can_view_consortium(request.user, consortium):
+        cache = get_request_cache(request)
+        if consortium and user_can_view_consortium(request.user, consortium, cache):
             # Only the consortium manager is allowed to access nested resources
             # However we want to explicitly deny permission in the case where the consortium
             # is visible to the user but they are not the manager
-            return request.user == consortium.manager
+            return consortium.manager_id == request.user.pk
         else:
             # Raise not found in the case where the consortium does not exist, but also in the
             # case where the consortium is not visible to the user
@@ -100,17 +107,20 @@ class ConsortiumQuotaViewSetPermissions(IsAuthenticated):
         if not super().has_permission(request, view):
             return False
         # Get the consortium using the key from the viewset
+        # Only the visibility and manager id are needed to check permissions
         consortium = (
-            Consortium.objects.prefetch_related("manager")
+            Consortium.objects.only("is_public", "manager")
             .filter(pk=view.kwargs["consortium_pk"])
             .first()
         )
-        if consortium and user_can_view_quota(request.user, consortium):
+        cache = get_request_cache(request)
+        if consortium and user_can_view_quota(request.user, consortium, cache):
             return True
         # If a user can see the consortium but can't see the quota, explicitly deny permission
-        elif consortium and user_can_view_consortium(request.user, consortium):
+        elif consortium and user_can_view_consortium(request.user, consortium, cache):
             return False
-        elif user_is_staff(request.user):
+        # We want staff to be able to see quotas
+        elif request.user.is_staff:
             return True
         else:
             # Raise not found in the case where the consortium does not exist, but also in the
@@ -1,5 +1,3 @@
-from rest_framework.permissions import IsAuthenticated
-
 from .base import BaseProjectPermissions
 
 
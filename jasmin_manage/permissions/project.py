@@ -1,5 +1,3 @@
-from _ast import Or
-
 from .base import BaseProjectPermissions
 
 
@@ -21,9 +19,10 @@ class ProjectPermissions(BaseProjectPermissions):
             return True
         elif action in {"retrieve", "events"}:
             return (
-                self.is_consortium_manager(project, user)
+                # Check staff first as it doesn't require a query
+                user.is_staff
+                or self.is_consortium_manager(project, user)
                 or self.is_project_collaborator(project, user)
-                or user.is_staff
             )
         elif action in {"update", "partial_update", "submit_for_review"}:
             return self.is_project_owner(project, user)
@@ -16,9 +16,10 @@ class RequirementPermissions(BaseProjectPermissions):
     def has_action_permission(self, project, user, action, obj=None):
         if action in {"list", "retrieve"}:
             return (
-                self.is_consortium_manager(project, user)
+                # Check staff first as it doesn't require a query
+                user.is_staff
+                or self.is_consortium_manager(project, user)
                 or self.is_project_collaborator(project, user)
-                or user.is_staff
             )
         elif action in {"create", "update", "partial_update", "destroy"}:
             # Any project collaborator can create, edit and delete requirements
@@ -19,9 +19,10 @@ class ServicePermissions(BaseProjectPermissions):
         if action in {"list", "retrieve"}:
             # Collaborators and consortium managers can see services
             return (
-                self.is_consortium_manager(project, user)
+                # Check staff first as it doesn't require a query
+                user.is_staff
+                or self.is_consortium_manager(project, user)
                 or self.is_project_collaborator(project, user)
-                or user.is_staff
             )
         elif action in {"create", "destroy"}:
             # Any project collaborator can create and delete services
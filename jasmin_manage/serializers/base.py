@@ -1,7 +1,10 @@
 import copy
 import functools
+import threading
+import weakref
 
 from django.urls import get_resolver, NoReverseMatch
+from django.utils.functional import cached_property
 
 from rest_framework import fields, relations, serializers
 from rest_framework.reverse import reverse as drf_reverse
@@ -17,8 +20,11 @@ class EnumField(fields.ChoiceField):
 
     def __init__(self, enum, **kwargs):
         self.enum = enum
+        # Map the enum values to names so that representing a value is a single lookup
+        # Enum members hash the same as their values, so this works for either
+        self.value_names = {v.value: v.name for v in enum}
         # Use the enum names for the choices
-        super().__init__([v.name for v in enum], **kwargs)
+        super().__init__(list(self.value_names.values()), **kwargs)
 
     def to_internal_value(self, data):
         if not data and self.allow_blank:
@@ -31,9 +37,104 @@ class EnumField(fields.ChoiceField):
     def to_representation(self, value):
         if value is None:
             return value
-        if not isinstance(value, self.enum):
-            value = self.enum(value)
-        return value.name
+        try:
+            return self.value_names[value]
+        except KeyError:
+            # Let the enum raise the appropriate error for an invalid value
+            return self.enum(value).name
+
+
+#: Placeholder used in place of the object key when reversing URL templates
+URL_PLACEHOLDER = "__value__"
+
+
+@functools.lru_cache(maxsize=None)
+def get_view_names(urlconf):
+    """
+    Returns the set of view names in the given urlconf.
+
+    The URL patterns do not change while the process is running, so the set is only
+    computed once for each urlconf.
+    """
+    views = get_resolver(urlconf).reverse_dict
+    return frozenset(key for key in views.keys() if isinstance(key, str))
+
+
+#: Cache of model links, indexed by model and then by (urlconf, basename)
+#: Keying on the model weakly means that transient model classes are not kept alive
+_model_links_cache = weakref.WeakKeyDictionary()
+_model_links_lock = threading.Lock()
+
+
+def get_model_links(urlconf, model, basename):
+    """
+    Returns the related object links, related list links and action links for the
+    given model and basename in the given urlconf.
+
+    Introspecting the model and the views is relatively expensive, so it is only done
+    once for each combination.
+    """
+    key = (urlconf, basename)
+    try:
+        return _model_links_cache[model][key]
+    except KeyError:
+        pass
+    # Hold the lock while computing so that concurrent threads don't duplicate the work
+    with _model_links_lock:
+        model_links = _model_links_cache.setdefault(model, {})
+        if key not in model_links:
+            model_links[key] = _get_model_links(urlconf, model, basename)
+        return model_links[key]
+
+
+def _get_model_links(urlconf, model, basename):
+    # Get information about the views in the app
+    views = get_resolver(urlconf).reverse_dict
+    view_names = get_view_names(urlconf)
+    # Calculate the views that correspond to related objects in either direction
+    related_object_links = []
+    related_list_links = []
+    for field in model._meta.get_fields():
+        if field.many_to_one or field.one_to_one:
+            view_name = "{}-detail".format(
+                field.related_model._meta.object_name.lower()
+            )
+            if view_name in view_names:
+                related_object_links.append(
+                    (field.name, view_name, field.get_attname())
+                )
+        elif field.one_to_many or field.many_to_many:
+            # If the field has a related name, use that, otherwise use the field name
+            field_name = getattr(field, "related_name", None) or field.name
+            view_name = "{}-{}-list".format(basename, field_name)
+            if view_name in view_names:
+                related_list_links.append((field_name, view_name))
+    # Calculate the views that correspond to extra actions
+    # Only views for this basename that are not already used for links are candidates
+    basename_prefix = basename + "-"
+    link_view_names = {link[1] for link in related_object_links}
+    link_view_names.update(link[1] for link in related_list_links)
+    action_links = []
+    for view_name in view_names:
+        if not view_name.startswith(basename_prefix):
+            continue
+        if view_name in link_view_names:
+            continue
+        action = view_name[len(basename_prefix) :]
+        # Exclude the default actions
+        if action in {"list", "detail"}:
+            continue
+        # We only want to include instance actions, i.e. those that accept a
+        # primary key as an argument
+        # We can get the names of the capture groups for the first URL in the resolver
+        view_capture_groups = views[view_name][0][0][1]
+        if "pk" in view_capture_groups:
+            action_links.append((action, view_name))
+    return (
+        tuple(related_object_links),
+        tuple(related_list_links),
+        tuple(action_links),
+    )
 
 
 @extend_schema_field(OpenApiTypes.OBJECT)
@@ -43,6 +144,8 @@ class LinksField(fields.Field):
 
     For model serializers, the basename and set of links will be automatically derived
     from the model. For non-model serializers, they must be specified manually.
+
+    If the serializer context contains ``links="self"``, only the self link is rendered.
     """
 
     def __init__(self, **kwargs):
@@ -53,6 +156,8 @@ class LinksField(fields.Field):
         self.action_links = kwargs.pop("action_links", None)
         kwargs.update(source="*", read_only=True)
         super().__init__(**kwargs)
+        # Cache of URL templates, indexed by (view name, kwarg name, format)
+        self._url_templates = {}
 
     def bind(self, field_name, parent):
         super().bind(field_name, parent)
@@ -69,46 +174,9 @@ class LinksField(fields.Field):
         # Derive the urlconf to use from the app containing the model
         if not self.urlconf:
             self.urlconf = "{}.urls".format(parent.Meta.model._meta.app_label)
-        # Get information about the views in the app
-        views = get_resolver(self.urlconf).reverse_dict
-        view_names = set(key for key in views.keys() if isinstance(key, str))
-        # Calculate the views that correspond to related objects in either direction
-        related_object_links = []
-        related_list_links = []
-        for field in parent.Meta.model._meta.get_fields():
-            if field.many_to_one or field.one_to_one:
-                view_name = "{}-detail".format(
-                    field.related_model._meta.object_name.lower()
-                )
-                if view_name in view_names:
-                    related_object_links.append(
-                        (field.name, view_name, field.get_attname())
-                    )
-            elif field.one_to_many or field.many_to_many:
-                # If the field has a related name, use that, otherwise use the field name
-                field_name = getattr(field, "related_name", None) or field.name
-                view_name = "{}-{}-list".format(self.basename, field_name)
-                if view_name in view_names:
-                    related_list_links.append((field_name, view_name))
-        # Calculate the views that correspond to extra actions
-        action_links = []
-        for view_name in view_names:
-            if not view_name.startswith(self.basename):
-                continue
-            if view_name in {link[1] for link in related_object_links}:
-                continue
-            if view_name in {link[1] for link in related_list_links}:
-                continue
-            action = view_name[len(self.basename) + 1 :]
-            # Exclude the default actions
-            if action in {"list", "detail"}:
-                continue
-            # We only want to include instance actions, i.e. those that accept a
-            # primary key as an argument
-            # We can get the names of the capture groups for the first URL in the resolver
-            view_capture_groups = views[view_name][0][0][1]
-            if "pk" in view_capture_groups:
-                action_links.append((action, view_name))
+        related_object_links, related_list_links, action_links = get_model_links(
+            self.urlconf, parent.Meta.model, self.basename
+        )
         if self.related_object_links is None:
             self.related_object_links = related_object_links
         if self.related_list_links is None:
@@ -116,64 +184,156 @@ class LinksField(fields.Field):
         if self.action_links is None:
             self.action_links = action_links
 
+    @cached_property
+    def detail_view_name(self):
+        """
+        The name of the view for the object itself.
+        """
+        return "{}-detail".format(self.basename)
+
+    @cached_property
+    def parent_kwarg(self):
+        """
+        The name of the keyword argument for the object in nested list views.
+        """
+        return "{}_pk".format(self.basename)
+
+    def get_url_template(self, view_name, kwarg, format):
+        """
+        Returns a template for the path of the given view that can be completed by
+        replacing the placeholder with the value for the given keyword argument, or
+        None if the view cannot be reversed with a placeholder.
+
+        Templates are cached so that the URL resolver is only used once for each view,
+        rather than once for each object.
+        """
+        key = (view_name, kwarg, format)
+        if key not in self._url_templates:
+            try:
+                self._url_templates[key] = drf_reverse(
+                    view_name, kwargs={kwarg: URL_PLACEHOLDER}, format=format
+                )
+            except NoReverseMatch:
+                # The view restricts the values it accepts, e.g. to integers
+                self._url_templates[key] = None
+        return self._url_templates[key]
+
+    def reverse_link(self, request, format, view_name, kwarg, kwarg_value):
+        """
+        Returns the absolute URL for the given view with the given keyword argument.
+        """
+        # When versioning is in use, DRF must be allowed to do the reversing
+        if kwarg_value is not None and not getattr(request, "versioning_scheme", None):
+            template = self.get_url_template(view_name, kwarg, format)
+            if template:
+                return request.build_absolute_uri(
+                    template.replace(URL_PLACEHOLDER, str(kwarg_value))
+                )
+        return drf_reverse(
+            view_name, kwargs={kwarg: kwarg_value}, request=request, format=format
+        )
+
     def to_representation(self, value):
         # Get the parameters we need for reversing
         request = self.context["request"]
         format = self.context.get("format", None)
         if format and self.format and self.format != format:
             format = self.format
-        reverse = lambda view_name, kwargs: drf_reverse(
-            view_name, kwargs=kwargs, request=request, format=format
-        )
+        # Bind the parameters that are the same for every link once
+        reverse = functools.partial(self.reverse_link, request, format)
         # Always start with the self link
-        links = dict(self=reverse("{}-detail".format(self.basename), dict(pk=value.pk)))
+        links = dict(self=reverse(self.detail_view_name, "pk", value.pk))
+        # Callers that only need the self link, e.g. large lists, can ask for just that
+        if self.context.get("links") == "self":
+            return links
         # Add links to the related objects
-        links.update(
-            {
-                name: reverse(view_name, dict(pk=getattr(value, attr)))
-                for name, view_name, attr in (self.related_object_links or [])
-            }
-        )
+        for name, view_name, attr in self.related_object_links or []:
+            links[name] = reverse(view_name, "pk", getattr(value, attr))
         # Add the related list links
-        links.update(
-            {
-                name: reverse(view_name, {self.basename + "_pk": value.pk})
-                for name, view_name in (self.related_list_links or [])
-            }
-        )
+        for name, view_name in self.related_list_links or []:
+            links[name] = reverse(view_name, self.parent_kwarg, value.pk)
         # Add extra actions to the links
-        links.update(
-            {
-                name: reverse(view_name, dict(pk=value.pk))
-                for name, view_name in (self.action_links or [])
-            }
-        )
+        for name, view_name in self.action_links or []:
+            links[name] = reverse(view_name, "pk", value.pk)
         return links
 
 
+def copy_fields(fields):
+    """
+    Returns a copy of the given fields that can be bound to a new serializer.
+    """
+    # Nested serializers, many-related fields and fields with a child field, e.g. list
+    # and dict fields, are bound to their children, so they need a deep copy to avoid
+    # sharing the children
+    # For all other fields, a shallow copy is sufficient and much cheaper
+    copied = {}
+    for name, field in fields.items():
+        if isinstance(
+            field, (serializers.BaseSerializer, relations.ManyRelatedField)
+        ) or hasattr(field, "child"):
+            copied[name] = copy.deepcopy(field)
+        else:
+            copied[name] = copy.copy(field)
+    return copied
+
+
 class BaseSerializer(serializers.ModelSerializer):
     """
     Base class for JASMIN Manage serializers.
     """
 
+    #: Indicates whether the fields can be built once and reused for the class
+    #: Serializers whose fields depend on the context must disable this
+    #: It is disabled automatically for subclasses that customise how fields are built
+    cache_fields = True
+    #: Cache of fields, indexed by serializer class
+    #: It is keyed weakly so that transient serializer classes are not kept alive
+    _fields_cache = weakref.WeakKeyDictionary()
+    #: Field names from the Meta class, populated for each subclass
+    _read_only_fields = _create_only_fields = _update_only_fields = ()
+
     _links = LinksField()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the field name lists from the Meta class once, when the class is defined
+        meta = getattr(cls, "Meta", None)
+        cls._read_only_fields = tuple(getattr(meta, "read_only_fields", ()))
+        cls._create_only_fields = tuple(getattr(meta, "create_only_fields", ()))
+        cls._update_only_fields = tuple(getattr(meta, "update_only_fields", ()))
+        # Fields built by overridden methods may depend on the context, e.g. the request,
+        # so don't cache them unless the subclass explicitly says it is safe to
+        if "cache_fields" not in cls.__dict__ and any(
+            getattr(cls, name) is not getattr(BaseSerializer, name)
+            for name in ("get_extra_kwargs", "build_field")
+        ):
+            cls.cache_fields = False
+
     def get_fields(self):
-        fields = super().get_fields()
-        # Move the links field to the end of the field list if present
-        links_field = fields.pop("_links", None)
-        if links_field:
-            fields["_links"] = links_field
+        # Building the fields for a model serializer is expensive, so only do it once
+        # for each serializer class and give each instance a copy
+        serializer_class = type(self)
+        if self.cache_fields and serializer_class in self._fields_cache:
+            fields = copy_fields(self._fields_cache[serializer_class])
+        else:
+            fields = super().get_fields()
+            # Move the links field to the end of the field list if present
+            links_field = fields.pop("_links", None)
+            if links_field:
+                fields["_links"] = links_field
+            if self.cache_fields:
+                self._fields_cache[serializer_class] = fields
+                fields = copy_fields(fields)
         # Apply read_only_fields even when the field classes are explicitly defined
-        for field_name in getattr(self.Meta, "read_only_fields", []):
+        for field_name in self._read_only_fields:
             fields[field_name].read_only = True
         # Use the presence of an instance to decide if it is an update or a create
         if self.instance:
             # For an update, make the create-only fields read-only
-            for field_name in getattr(self.Meta, "create_only_fields", []):
+            for field_name in self._create_only_fields:
                 fields[field_name].read_only = True
         else:
             # For a create, make the update-only fields read-only
-            for field_name in getattr(self.Meta, "update_only_fields", []):
+            for field_name in self._update_only_fields:
                 fields[field_name].read_only = True
         return fields
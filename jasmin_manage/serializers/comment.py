@@ -4,7 +4,7 @@ from rest_framework import serializers
 
 from ..models import Comment
 
-from .base import BaseSerializer, EnumField
+from .base import BaseSerializer
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -1,11 +1,17 @@
+from collections import defaultdict
+
 from django.contrib.auth import get_user_model
+from django.db.models import Max, Min, Prefetch, Sum
 from rest_framework import serializers
-import datetime as dt
 
-from ..models import Consortium, Project, Quota, Resource
+from ..models import Collaborator, Consortium, Quota, Requirement, Resource
 from .base import BaseSerializer
 
 
+#: Names used for the collaborator roles in the project summaries, indexed by value
+COLLABORATOR_ROLE_NAMES = {role.value: role.name.lower() for role in Collaborator.Role}
+
+
 class ManagerSerializer(serializers.ModelSerializer):
     """
     Serializer for the manager of a consortium.
@@ -53,60 +59,73 @@ class ConsortiumSummarySerializer(serializers.ModelSerializer):
 
     def get_project_summaries(self, obj):
         """Create a summary of the resource provision for the consortium and the projects under that consortium."""
-        # Get projects from consortium object and loop through to build per project provioned information for resources
-        projects = obj.projects.all()
+        # Fetch the tags and collaborators for all the projects up front, rather than
+        # querying for each project
+        # Only the columns used to describe the collaborators are loaded, rather than
+        # the whole user record
+        collaborators = Collaborator.objects.select_related("user").only(
+            "project", "role", "user__username", "user__first_name", "user__last_name"
+        )
+        projects = obj.projects.prefetch_related(
+            "tags", Prefetch("collaborators", queryset=collaborators)
+        )
+        # Total the provisioned requirements for each project and resource in the
+        # database, along with the range of end dates, using a single query
+        requirements = defaultdict(list)
+        for project_id, resource, total, earliest, latest in (
+            Requirement.objects.filter(
+                service__project__consortium=obj,
+                status=Requirement.Status.PROVISIONED,
+            )
+            .order_by()
+            .values("service__project_id", "resource__name")
+            .annotate(
+                total=Sum("amount"), earliest=Min("end_date"), latest=Max("end_date")
+            )
+            .values_list(
+                "service__project_id", "resource__name", "total", "earliest", "latest"
+            )
+        ):
+            requirements[project_id].append((resource, total, earliest, latest))
+        # Get the resource names to build the per-project totals from
+        resource_names = list(Resource.objects.values_list("name", flat=True))
         data = []
-        # Get the resources to build dict from
-        resqueryset = Resource.objects.all()
-        collab_lookup = {20: "contributor", 40: "owner"}
-        for p in projects:
-            name = p.name
-            tags = [t["name"] for t in p.tags.values()]
-            services = p.services.all()
-            # We want total resouces for the project so init requirements dict here, not per service
-            requirement_data = {res.name: 0 for res in resqueryset}
-            # We want the earliest and latest end date for the requirements in the project
-            earliest = dt.date(9999, 12, 30)  # Set high so first one is sooner
-            latest = dt.date(1, 1, 1)  # Set low so first one is higher
-            for s in services:
-                requirments = s.requirements.all()
-                for r in requirments:
-                    if r.status == 50:  # This is the code for provisioned requirements
-                        resource = r.resource.name
-                        amount = r.amount
-                        requirement_data[resource] += amount
-                        if r.end_date <= earliest:
-                            earliest = r.end_date
-                        if r.end_date > latest:
-                            latest = r.end_date
-
+        # Iterate over the projects in chunks so that large consortia do not hold every
+        # project instance in memory at once
+        for p in projects.iterator(chunk_size=200):
+            # We want total resources for the project, so each project gets its own dict
+            requirement_data = dict.fromkeys(resource_names, 0)
+            earliest_dates = []
+            latest_dates = []
+            for resource, total, earliest, latest in requirements[p.id]:
+                requirement_data[resource] = total
+                earliest_dates.append(earliest)
+                latest_dates.append(latest)
             # Get collaborator information to add to the summary
-            collaborators = p.collaborators.all()
-            collaborators_data = []
-            for c in collaborators:
-                # Removed email as not sure on the permissions scoping for access to the summaries
-                user = c.user.get_username()
-                full_name = c.user.get_full_name()
-                role = collab_lookup[c.role]
-                collaborators_data.append(
-                    {"username": user, "name": full_name, "role": role}
-                )
-            # If the end dates dates haven't changed, set value to None
-            if earliest == dt.date(9999, 12, 30):
-                earliest = None
-            if latest == dt.date(1, 1, 1):
-                latest = None
-            project_data = {
-                "id": p.id,
-                "project_name": name,
-                "tags": tags,
-                "collaborators": collaborators_data,
-                "resource_summary": requirement_data,
-                "requirement_end_dates": {"earliest": earliest, "latest": latest},
-            }
-
-            data.append(project_data)
-
+            # Removed email as not sure on the permissions scoping for access to the summaries
+            collaborators_data = [
+                {
+                    "username": c.user.get_username(),
+                    "name": c.user.get_full_name(),
+                    "role": COLLABORATOR_ROLE_NAMES[c.role],
+                }
+                for c in p.collaborators.all()
+            ]
+            data.append(
+                {
+                    "id": p.id,
+                    "project_name": p.name,
+                    "tags": [t.name for t in p.tags.all()],
+                    "collaborators": collaborators_data,
+                    "resource_summary": requirement_data,
+                    # We want the earliest and latest end date for the requirements in
+                    # the project, or None if there are no provisioned requirements
+                    "requirement_end_dates": {
+                        "earliest": min(earliest_dates, default=None),
+                        "latest": max(latest_dates, default=None),
+                    },
+                }
+            )
         return data
 
 
@@ -1,11 +1,6 @@
-from django.contrib.auth import get_user_model
-from django.forms import model_to_dict
-
-from rest_framework import serializers
-
 from ..models import Invitation
 
-from .base import BaseSerializer, EnumField
+from .base import BaseSerializer
 
 
 class InvitationSerializer(BaseSerializer):
@@ -4,6 +4,10 @@ from ..models import Collaborator, Project
 from .base import BaseSerializer, EnumField
 
 
+#: Names of the collaborator roles, indexed by value
+ROLE_NAMES = {role.value: role.name for role in Collaborator.Role}
+
+
 class ProjectSerializer(BaseSerializer):
     """
     Serializer for the project model.
@@ -51,6 +55,6 @@ class ProjectSerializer(BaseSerializer):
     def get_current_user_role(self, obj):
         role = obj.get_current_user_role(self.context["request"].user)
         if role:
-            return Collaborator.Role(role).name
+            return ROLE_NAMES[role]
         else:
             return None
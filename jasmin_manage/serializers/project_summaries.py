@@ -1,6 +1,7 @@
+from django.db.models import Sum
 from rest_framework import serializers
 
-from ..models import Collaborator, Project, Resource
+from ..models import Project, Requirement, Resource
 from .base import BaseSerializer, EnumField
 
 
@@ -40,8 +41,8 @@ class ProjectSummarySerializer(BaseSerializer):
 
     def get_tags(self, obj):
         """Convert the tags into the names."""
-        tags = [t["name"] for t in obj.tags.values()]
-        return tags
+        # Use all() rather than values() so that prefetched tags are used
+        return [t.name for t in obj.tags.all()]
 
     def get_consortium(self, obj):
         """Convert the consortium into its name."""
@@ -49,16 +50,24 @@ class ProjectSummarySerializer(BaseSerializer):
 
     def get_resource_summary(self, obj):
         """Create summary of all resources under the project"""
-        services = obj.services.all()
-        resqueryset = Resource.objects.all()
-        tags = [t["name"] for t in obj.tags.values()]
+        # The resource names are the same for every project, so only fetch them once
+        # and keep them in the context, which is shared by all the projects in a list
+        resource_names = self.context.get("resource_names")
+        if resource_names is None:
+            resource_names = self.context["resource_names"] = list(
+                Resource.objects.values_list("name", flat=True)
+            )
         # We want total resouces for the project so init requirements dict here, not per service
-        requirement_data = {res.name: 0 for res in resqueryset}
-        for s in services:
-            requirments = s.requirements.all()
-            for r in requirments:
-                if r.status == 50:  # This is the code for provisioned requirements
-                    resource = r.resource.name
-                    amount = r.amount
-                    requirement_data[resource] += amount
+        requirement_data = dict.fromkeys(resource_names, 0)
+        # Total the provisioned requirements for each resource in the database, rather
+        # than fetching every requirement for every service
+        requirement_data.update(
+            Requirement.objects.filter(
+                service__project=obj, status=Requirement.Status.PROVISIONED
+            )
+            .order_by()
+            .values("resource__name")
+            .annotate(total=Sum("amount"))
+            .values_list("resource__name", "total")
+        )
         return requirement_data
@@ -24,6 +24,7 @@ class RequirementSerializer(BaseSerializer):
     amount = serializers.IntegerField(min_value=1)
 
     def get_extra_kwargs(self):
+        # Because this is overridden, the fields are not cached for the class
         extra_kwargs = super().get_extra_kwargs()
         # Use the service to limit the set of resources that are possible
         # The resource is only writable during create, so using the service from
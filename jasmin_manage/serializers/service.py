@@ -66,7 +66,7 @@ class ServiceSerializer(BaseSerializer):
 
     class Meta:
         model = Service
-        fields = "__all__"
+        fields = ["id", "category", "project", "name", "_links"]
         # Replace the default unique_together validator for category and name
         # in order to customise the error message
         validators = [CategoryNameUniqueTogether()]
@@ -86,10 +86,18 @@ class ServiceListSerializer(BaseSerializer):
 
     requirements = ServiceRequirementSerializer(many=True)
     # Add fields for summary data
-    has_active_requirements = serializers.SerializerMethodField()
-    consortium = serializers.SerializerMethodField()
-    consortium_fairshare = serializers.SerializerMethodField()
-    project_fairshare = serializers.SerializerMethodField()
+    # These read straight from the service and its joined project and consortium
+    # DRF calls model methods used as sources, e.g. has_active_requirements
+    has_active_requirements = serializers.BooleanField(read_only=True)
+    consortium = serializers.IntegerField(
+        source="get_parent_consortium", read_only=True
+    )
+    consortium_fairshare = serializers.IntegerField(
+        source="project.consortium.fairshare", read_only=True
+    )
+    project_fairshare = serializers.IntegerField(
+        source="project.fairshare", read_only=True
+    )
 
     class Meta:
         model = Service
@@ -115,19 +123,3 @@ class ServiceListSerializer(BaseSerializer):
         # Inject the project from the context into the model
         validated_data.update(project=self.context["project"])
         return super().create(validated_data)
-
-    def get_has_active_requirements(self, obj):
-        # Works out if there are any active requirements in the service
-        return True if obj.get_num_active_requirements() else False
-
-    def get_consortium(self, obj):
-        # Get the parent project's consortium
-        return obj.project.consortium.id
-
-    def get_consortium_fairshare(self, obj):
-        # Get the fairshare for the parent consortium
-        return obj.project.consortium.fairshare
-
-    def get_project_fairshare(self, obj):
-        # Get the fairshare for the parent consortium
-        return obj.project.fairshare
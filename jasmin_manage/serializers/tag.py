@@ -10,4 +10,4 @@ class TagSerializer(BaseSerializer):
 
     class Meta:
         model = Tag
-        fields = "__all__"
+        fields = ["id", "name", "_links"]
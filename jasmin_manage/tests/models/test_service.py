@@ -1,9 +1,9 @@
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError
-from django.db.models import ProtectedError
+from django.db.models import Count, ProtectedError, Q
 from django.test import TestCase
 
-from ...models import Category, Consortium, Project, Service
+from ...models import Category, Consortium, Project, Requirement, Resource, Service
 from ..utils import AssertValidationErrorsMixin
 
 
@@ -98,3 +98,37 @@ class ServiceModelTestCase(AssertValidationErrorsMixin, TestCase):
     def test_get_by_natural_key(self):
         service = Service.objects.get_by_natural_key("Category 1", "service1")
         self.assertEqual(service.pk, 1)
+
+    def test_get_parent_consortium(self):
+        service = Service.objects.first()
+        self.assertEqual(service.get_parent_consortium(), self.consortium.pk)
+        # When the project is already loaded, no query is required
+        service = Service.objects.select_related("project").first()
+        with self.assertNumQueries(0):
+            self.assertEqual(service.get_parent_consortium(), self.consortium.pk)
+
+    def test_has_active_requirements(self):
+        service = Service.objects.first()
+        self.assertFalse(service.has_active_requirements())
+        resource = Resource.objects.create(name="Resource 1")
+        requirement = service.requirements.create(resource=resource, amount=10)
+        self.assertFalse(service.has_active_requirements())
+        requirement.status = Requirement.Status.PROVISIONED
+        requirement.save()
+        self.assertTrue(service.has_active_requirements())
+
+    def test_has_active_requirements_annotated(self):
+        # When the queryset is annotated with the count, no query is required
+        service = Service.objects.first()
+        resource = Resource.objects.create(name="Resource 1")
+        service.requirements.create(
+            resource=resource, amount=10, status=Requirement.Status.PROVISIONED
+        )
+        service = Service.objects.annotate(
+            num_active_requirements=Count(
+                "requirement",
+                filter=Q(requirement__status=Requirement.Status.PROVISIONED),
+            )
+        ).first()
+        with self.assertNumQueries(0):
+            self.assertTrue(service.has_active_requirements())
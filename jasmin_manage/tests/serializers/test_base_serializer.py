@@ -104,3 +104,84 @@ class BaseSerializerTestCase(TestCase):
         serializer = serializer_class(Project(name="Project 1"))
         for field_name, field in serializer.get_fields().items():
             self.assertFalse(field.read_only)
+
+    def test_fields_cached(self):
+        # Test that the fields are built once for the class and copied for each instance
+        serializer_class = type(
+            "ProjectSerializer",
+            (BaseSerializer,),
+            {
+                "Meta": type(
+                    "Meta",
+                    (),
+                    {
+                        "model": Project,
+                        "fields": ("name", "description", "consortium", "tags"),
+                        "create_only_fields": ("consortium",),
+                    },
+                ),
+            },
+        )
+        # The create-only field should be read-only when there is an instance
+        fields1 = serializer_class(Project(name="Project 1")).get_fields()
+        self.assertIn(serializer_class, BaseSerializer._fields_cache)
+        fields2 = serializer_class(Project(name="Project 2")).get_fields()
+        # Each instance should get the same fields, but not the same field objects
+        self.assertEqual(list(fields1), list(fields2))
+        for field_name in fields1:
+            self.assertIsNot(fields1[field_name], fields2[field_name])
+            self.assertIs(type(fields1[field_name]), type(fields2[field_name]))
+        # The many-related field should not share its child between instances
+        self.assertIsNot(fields1["tags"].child_relation, fields2["tags"].child_relation)
+        # The cached fields should not be modified by the instances
+        cached = BaseSerializer._fields_cache[serializer_class]
+        self.assertFalse(cached["consortium"].read_only)
+        self.assertTrue(fields1["consortium"].read_only)
+        self.assertTrue(fields2["consortium"].read_only)
+        # An instance without the flag applied should get a writable field
+        fields3 = serializer_class().get_fields()
+        self.assertFalse(fields3["consortium"].read_only)
+        # A field with a child field should not share its child between instances
+        serializer_class = type(
+            "ProjectSerializer",
+            (BaseSerializer,),
+            {
+                "Meta": type("Meta", (), {"model": Project, "fields": ("names",)}),
+                "names": serializers.ListField(child=serializers.CharField()),
+            },
+        )
+        fields1 = serializer_class().get_fields()
+        fields2 = serializer_class().get_fields()
+        self.assertIsNot(fields1["names"].child, fields2["names"].child)
+        self.assertIs(fields1["names"].child.parent, fields1["names"])
+        self.assertIs(fields2["names"].child.parent, fields2["names"])
+
+    def test_fields_not_cached_when_built_from_context(self):
+        # Test that the fields are not cached when the subclass customises how they are
+        # built, as they may depend on the context
+        meta = type("Meta", (), {"model": Project, "fields": ("name",)})
+
+        def get_extra_kwargs(self):
+            return super(serializer_class, self).get_extra_kwargs()
+
+        serializer_class = type(
+            "ProjectSerializer",
+            (BaseSerializer,),
+            {"Meta": meta, "get_extra_kwargs": get_extra_kwargs},
+        )
+        self.assertFalse(serializer_class.cache_fields)
+        serializer_class().get_fields()
+        self.assertNotIn(serializer_class, BaseSerializer._fields_cache)
+        # Subclasses should inherit the setting
+        subclass = type("ProjectSubSerializer", (serializer_class,), {"Meta": meta})
+        self.assertFalse(subclass.cache_fields)
+        # Unless they say explicitly that the fields can be cached
+        subclass = type(
+            "ProjectSubSerializer",
+            (serializer_class,),
+            {"Meta": meta, "cache_fields": True},
+        )
+        self.assertTrue(subclass.cache_fields)
+        # Serializers that don't customise the fields should be cached
+        serializer_class = type("ProjectSerializer", (BaseSerializer,), {"Meta": meta})
+        self.assertTrue(serializer_class.cache_fields)
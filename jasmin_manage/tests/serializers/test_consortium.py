@@ -1,11 +1,13 @@
+from datetime import date
+
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
 from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory, force_authenticate
 
-from ...models import Consortium
-from ...serializers import ConsortiumSerializer
+from ...models import Category, Consortium, Requirement, Resource
+from ...serializers import ConsortiumSerializer, ConsortiumSummarySerializer
 
 
 class ConsortiumSerializerTestCase(TestCase):
@@ -79,3 +81,74 @@ class ConsortiumSerializerTestCase(TestCase):
         self.assertEqual(
             serializer.data["manager"]["last_name"], consortium.manager.last_name
         )
+
+
+class ConsortiumSummarySerializerTestCase(TestCase):
+    """
+    Tests for the consortium summary serializer.
+    """
+
+    def test_project_summaries(self):
+        """
+        Tests that the project summaries only include provisioned requirements and
+        that each project is summarised separately.
+        """
+        resource1 = Resource.objects.create(name="Resource 1")
+        resource2 = Resource.objects.create(name="Resource 2")
+        category = Category.objects.create(name="Category 1")
+        category.resources.add(resource1, resource2)
+        consortium = Consortium.objects.create(
+            name="Consortium 1",
+            description="Some description.",
+            manager=get_user_model().objects.create_user("manager1"),
+        )
+        project1 = consortium.projects.create(
+            name="Project 1",
+            description="Some description.",
+            owner=get_user_model().objects.create_user("owner1"),
+        )
+        project2 = consortium.projects.create(
+            name="Project 2",
+            description="Some description.",
+            owner=get_user_model().objects.create_user("owner2"),
+        )
+        service = project1.services.create(name="service1", category=category)
+        service.requirements.create(
+            resource=resource1,
+            amount=10,
+            status=Requirement.Status.PROVISIONED,
+            end_date=date(2030, 1, 1),
+        )
+        service.requirements.create(
+            resource=resource1,
+            amount=20,
+            status=Requirement.Status.PROVISIONED,
+            end_date=date(2031, 1, 1),
+        )
+        # Requirements that are not provisioned should not be counted
+        service.requirements.create(resource=resource2, amount=40)
+        # The projects, tags, collaborators, requirements and resources are each
+        # fetched once, however many projects there are
+        serializer = ConsortiumSummarySerializer(consortium)
+        with self.assertNumQueries(5):
+            summaries = serializer.get_project_summaries(consortium)
+        self.assertEqual(
+            [summary["id"] for summary in summaries], [project1.pk, project2.pk]
+        )
+        self.assertEqual(
+            summaries[0]["resource_summary"], {"Resource 1": 30, "Resource 2": 0}
+        )
+        self.assertEqual(
+            summaries[0]["requirement_end_dates"],
+            {"earliest": date(2030, 1, 1), "latest": date(2031, 1, 1)},
+        )
+        self.assertEqual(
+            summaries[0]["collaborators"],
+            [{"username": "owner1", "name": "", "role": "owner"}],
+        )
+        self.assertEqual(
+            summaries[1]["resource_summary"], {"Resource 1": 0, "Resource 2": 0}
+        )
+        self.assertEqual(
+            summaries[1]["requirement_end_dates"], {"earliest": None, "latest": None}
+        )
@@ -105,3 +105,30 @@ class LinksFieldTestCase(TestCase):
                 "submit-for-review": "http://testserver/projects/1/submit_for_review/",
             },
         )
+
+    def test_to_representation_self_only(self):
+        # Test that only the self link is generated when requested in the context
+        consortium = Consortium.objects.create(
+            name="Consortium 1",
+            description="some description",
+            manager=get_user_model().objects.create_user("manager1"),
+        )
+        project = consortium.projects.create(
+            name="Project 1",
+            description="some description",
+            owner=get_user_model().objects.create_user("owner1"),
+        )
+        request = APIRequestFactory().get("/projects/")
+        field = LinksField(
+            basename="project",
+            related_object_links=[("consortium", "consortium-detail", "consortium_id")],
+            related_list_links=[("services", "project-services-list")],
+            action_links=[("submit-for-review", "project-submit-for-review")],
+        )
+        field.parent = SimpleNamespace(
+            _context={"request": request, "links": "self"}, parent=None
+        )
+        self.assertEqual(
+            field.to_representation(project),
+            {"self": "http://testserver/projects/{}/".format(project.pk)},
+        )
@@ -0,0 +1,207 @@
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from .. import notifications
+from ..models import Category, Collaborator, Consortium, Requirement, Resource
+
+
+class NotifyCollaboratorsTestCase(TestCase):
+    """
+    Tests for the helper that notifies the collaborators on a project.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        UserModel = get_user_model()
+        consortium = Consortium.objects.create(
+            name="Consortium 1",
+            description="some description",
+            manager=UserModel.objects.create_user("manager1"),
+        )
+        cls.project = consortium.projects.create(
+            name="Project 1",
+            description="some description",
+            owner=UserModel.objects.create_user("owner1", email="owner1@example.com"),
+        )
+        for i in range(10):
+            cls.project.collaborators.create(
+                user=UserModel.objects.create_user(
+                    f"contributor{i}", email=f"contributor{i}@example.com"
+                ),
+                role=Collaborator.Role.CONTRIBUTOR,
+            )
+        # Collaborators without an email address should not be notified
+        cls.project.collaborators.create(
+            user=UserModel.objects.create_user("noemail"),
+            role=Collaborator.Role.CONTRIBUTOR,
+        )
+
+    def test_notify_collaborators(self):
+        collaborators = self.project.collaborators.select_related("user")
+        with mock.patch.object(notifications.Notification, "create") as create:
+            # The collaborators are fetched in a single query
+            with self.assertNumQueries(1):
+                notifications.notify_collaborators(mock.sentinel.event, collaborators)
+        self.assertCountEqual(
+            [call.args for call in create.call_args_list],
+            [
+                (
+                    mock.sentinel.event,
+                    "owner1@example.com",
+                    dict(project_role="OWNER"),
+                )
+            ]
+            + [
+                (
+                    mock.sentinel.event,
+                    f"contributor{i}@example.com",
+                    dict(project_role="CONTRIBUTOR"),
+                )
+                for i in range(10)
+            ],
+        )
+
+
+@override_settings(
+    SLACK_NOTIFICATIONS={
+        "WEBHOOK_URL": "https://hooks.example.com/webhook",
+        "SERVICE_REQUEST_URL": "https://example.com/services/",
+    }
+)
+class SlackProjectSubmittedForProvisioningTestCase(TestCase):
+    """
+    Tests for the slack notification when a project is submitted for provisioning.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        UserModel = get_user_model()
+        disk = Resource.objects.create(name="Disk", units="TB")
+        cpus = Resource.objects.create(name="CPUs")
+        category = Category.objects.create(name="Category 1")
+        category.resources.add(disk, cpus)
+        consortium = Consortium.objects.create(
+            name="Consortium 1",
+            description="some description",
+            manager=UserModel.objects.create_user("manager1"),
+        )
+        cls.owner = UserModel.objects.create_user("owner1")
+        cls.project = consortium.projects.create(
+            name="Project 1", description="some description", owner=cls.owner
+        )
+        cls.service1 = cls.project.services.create(name="service1", category=category)
+        cls.service1.requirements.create(
+            resource=disk,
+            amount=10,
+            status=Requirement.Status.AWAITING_PROVISIONING,
+        )
+        cls.service2 = cls.project.services.create(name="service2", category=category)
+        cls.service2.requirements.create(
+            resource=cpus,
+            amount=20,
+            status=Requirement.Status.AWAITING_PROVISIONING,
+        )
+        # Requirements that are not awaiting provisioning should not be included
+        cls.service2.requirements.create(resource=cpus, amount=30)
+
+    def notify(self, status_code=200, side_effect=None):
+        """
+        Sends the notification for the project and returns the mocked post.
+
+        The message is posted by the slack executor once the transaction commits, so
+        wait for the executor to finish before returning.
+        """
+        event = SimpleNamespace(target=self.project, user=self.owner)
+        response = mock.Mock(status_code=status_code, text="error text")
+        with mock.patch.object(notifications.requests, "post") as post:
+            post.return_value = response
+            post.side_effect = side_effect
+            with self.captureOnCommitCallbacks(execute=True):
+                notifications.notify_slack_project_submitted_for_provisioning(event)
+                # Nothing should be sent until the transaction commits
+                post.assert_not_called()
+            # The executor has a single worker, so once a no-op submitted after the
+            # message has run, the message has been posted
+            notifications.slack_executor.submit(lambda: None).result()
+        return post
+
+    def assertMessagePosted(self, post, comment_str):
+        """
+        Asserts that the expected message was posted with the given comment text.
+        """
+        post.assert_called_once()
+        self.assertEqual(post.call_args.args, ("https://hooks.example.com/webhook",))
+        self.assertEqual(post.call_args.kwargs["timeout"], 5)
+        message = post.call_args.kwargs["json"]
+        self.assertEqual(
+            message["text"], "New requirement[s] submitted for provisioning."
+        )
+        self.assertEqual(
+            message["blocks"][0]["text"]["text"],
+            "New requirement[s] submitted for provisioning for the 'Project 1' "
+            "project in the 'Consortium 1' consortium.",
+        )
+        self.assertEqual(message["blocks"][1]["fields"][0]["text"], comment_str)
+        # Each requirement should be included, with the units when there are some
+        self.assertEqual(
+            message["blocks"][2]["fields"][0]["text"],
+            (
+                "\n *Service:      * "
+                f"<https://example.com/services/{self.service1.pk}|service1>"
+                "\n*Resource:  * Disk"
+                "\n *Amount:    *10TB\n"
+                "\n *Service:      * "
+                f"<https://example.com/services/{self.service2.pk}|service2>"
+                "\n*Resource:  * CPUs"
+                "\n *Amount:    *20\n"
+            ),
+        )
+
+    def test_message(self):
+        # Only the latest comment should be included
+        comment = self.project.comments.create(content="New comment.", user=self.owner)
+        self.project.comments.create(content="Old comment.", user=self.owner)
+        # The created time is set automatically, so move the old comment back in time
+        self.project.comments.filter(content="Old comment.").update(
+            created_at=comment.created_at - timedelta(days=1)
+        )
+        post = self.notify()
+        self.assertMessagePosted(
+            post,
+            ">*Comment:*\n>*{}* ' _New comment._ '".format(
+                comment.created_at.strftime("%d %b %y %H:%M")
+            ),
+        )
+
+    def test_message_no_comment(self):
+        post = self.notify()
+        self.assertMessagePosted(post, ">*Comment:*\n>_No comment given._")
+
+    def test_error_response_logged(self):
+        # An error from slack should be logged rather than raised
+        with self.assertLogs(notifications.logger, "ERROR") as logs:
+            post = self.notify(status_code=500)
+        post.assert_called_once()
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("500", logs.output[0])
+        self.assertIn("error text", logs.output[0])
+
+    def test_request_exception_logged(self):
+        # A failure to reach slack should be logged rather than lost
+        with self.assertLogs(notifications.logger, "ERROR") as logs:
+            post = self.notify(side_effect=notifications.requests.ConnectionError)
+        post.assert_called_once()
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("Request to slack failed", logs.output[0])
+
+    @override_settings(
+        SLACK_NOTIFICATIONS={"WEBHOOK_URL": "", "SERVICE_REQUEST_URL": ""}
+    )
+    def test_no_webhook(self):
+        # Without a webhook, nothing should be sent
+        post = self.notify()
+        post.assert_not_called()
@@ -27,6 +27,14 @@ class BaseViewSet(viewsets.GenericViewSet):
                 return permission_classes
         return super().get_permissions()
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        # Allow clients to request only the self link for each object in a list,
+        # which saves building the full set of links for every object
+        if self.action == "list" and self.request.query_params.get("links") == "self":
+            context.update(links="self")
+        return context
+
 
 class TokenHasAtLeastOneScope(rf_perms.BasePermission):
     """
@@ -19,7 +19,7 @@ class CollaboratorViewSet(
 
     permission_classes = [CollaboratorPermissions]
 
-    queryset = Collaborator.objects.all()
+    queryset = Collaborator.objects.select_related("project__consortium")
     serializer_class = CollaboratorSerializer
 
     def _is_sole_owner(self, instance):
@@ -19,5 +19,5 @@ class CommentViewSet(
 
     permission_classes = [CommentPermissions]
 
-    queryset = Comment.objects.all()
+    queryset = Comment.objects.select_related("project__consortium")
     serializer_class = CommentSerializer
@@ -24,7 +24,8 @@ class ConsortiumViewSet(BaseViewSet, viewsets.ReadOnlyModelViewSet):
 
     permission_classes = [ConsortiumPermissions]
 
-    queryset = Consortium.objects.prefetch_related("manager", "quotas")
+    # The manager is a foreign key, so join it rather than prefetching it
+    queryset = Consortium.objects.select_related("manager").prefetch_related("quotas")
     serializer_class = ConsortiumSerializer
     action_serializers = {"summary": ConsortiumSummarySerializer}
 
@@ -16,5 +16,5 @@ class InvitationViewSet(
 
     permission_classes = [InvitationPermissions]
 
-    queryset = Invitation.objects.all()
+    queryset = Invitation.objects.select_related("project__consortium")
     serializer_class = InvitationSerializer
@@ -174,7 +174,8 @@ class ProjectViewSet(
 
     permission_classes = [ProjectPermissions]
 
-    queryset = Project.objects.all()
+    # Both the project and project summary serializers render the tags for each project
+    queryset = Project.objects.select_related("consortium").prefetch_related("tags")
     serializer_class = ProjectSerializer
 
     def get_serializer_class(self):
@@ -197,6 +198,10 @@ class ProjectViewSet(
                 if self.action == "list":
                     queryset = queryset.filter(collaborator__user=self.request.user)
                 return queryset
+        # The summary serializer only uses a few columns of the project and consortium,
+        # so avoid loading the rest, e.g. the descriptions
+        if self.request.query_params.get("summary", False) and self.action == "list":
+            queryset = queryset.only("id", "name", "status", "consortium__name")
         return queryset
 
     @action(detail=True, serializer_class=EventSerializer)
@@ -364,7 +369,10 @@ class ProjectCollaboratorsViewSet(
     # This property is required for the permissions check for listing
     @cached_property
     def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_pk"])
+        # The consortium is used by the permissions
+        return get_object_or_404(
+            Project.objects.select_related("consortium"), pk=self.kwargs["project_pk"]
+        )
 
 
 class ProjectCommentsViewSet(
@@ -392,7 +400,10 @@ class ProjectCommentsViewSet(
     # This property is required for the permissions check for listing
     @cached_property
     def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_pk"])
+        # The consortium is used by the permissions
+        return get_object_or_404(
+            Project.objects.select_related("consortium"), pk=self.kwargs["project_pk"]
+        )
 
 
 class ProjectInvitationsViewSet(
@@ -420,7 +431,10 @@ class ProjectInvitationsViewSet(
     # This property is required for the permissions check for listing
     @cached_property
     def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_pk"])
+        # The consortium is used by the permissions
+        return get_object_or_404(
+            Project.objects.select_related("consortium"), pk=self.kwargs["project_pk"]
+        )
 
 
 class ProjectServicesViewSet(
@@ -440,7 +454,10 @@ class ProjectServicesViewSet(
 
     @cached_property
     def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_pk"])
+        # The consortium is used by the permissions
+        return get_object_or_404(
+            Project.objects.select_related("consortium"), pk=self.kwargs["project_pk"]
+        )
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -474,4 +491,7 @@ class ProjectTagsViewSet(
 
     @cached_property
     def project(self):
-        return get_object_or_404(Project, pk=self.kwargs["project_pk"])
+        # The consortium is used by the permissions
+        return get_object_or_404(
+            Project.objects.select_related("consortium"), pk=self.kwargs["project_pk"]
+        )
@@ -4,7 +4,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from ..models import Invitation
+from ..models import Invitation, Project
 from ..serializers import ProjectSerializer
 
 
@@ -50,8 +50,13 @@ class ProjectJoinView(APIView):
         # If we did find an invitation, accept it as the logged in user
         invitation.accept(request.user)
         # Return the representation of the project that we just joined
+        # Fetch it with the summary annotations so the counts and the user's role come
+        # from a single query rather than one query each
+        project = Project.objects.annotate_summary(request.user).get(
+            pk=invitation.project_id
+        )
         project_serializer = ProjectSerializer(
-            invitation.project, context=dict(request=request, view=self)
+            project, context=dict(request=request, view=self)
         )
         return Response(project_serializer.data)
 
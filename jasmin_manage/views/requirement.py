@@ -22,7 +22,7 @@ class RequirementViewSet(
 
     permission_classes = [RequirementPermissions]
 
-    queryset = Requirement.objects.all()
+    queryset = Requirement.objects.select_related("service__project__consortium")
     serializer_class = RequirementSerializer
 
     def _check_editable(self, requirement):
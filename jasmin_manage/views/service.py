@@ -1,3 +1,4 @@
+from django.db.models import Count, Prefetch, Q
 from django.utils.functional import cached_property
 
 from rest_framework import mixins, viewsets
@@ -29,7 +30,17 @@ class ServiceViewSet(
     View set for the service model.
     """
 
-    queryset = Service.objects.all().prefetch_related("requirements")
+    # The list serializer nests the requirements with their resources
+    queryset = (
+        Service.objects.all()
+        .select_related("project__consortium")
+        .prefetch_related(
+            Prefetch(
+                "requirements",
+                queryset=Requirement.objects.select_related("resource"),
+            )
+        )
+    )
     permission_classes = [ServicePermissions]
     required_scopes = ["jasmin.projects.services.all", "jasmin.projects.all"]
 
@@ -42,6 +53,15 @@ class ServiceViewSet(
         name = self.request.query_params.get('name')
         if name is not None:
             queryset = queryset.filter(name=name)
+        # The list serializer reports whether each service has active requirements,
+        # so count them in the same query rather than once per service
+        if self.action == "list":
+            queryset = queryset.annotate(
+                num_active_requirements=Count(
+                    "requirement",
+                    filter=Q(requirement__status=Requirement.Status.PROVISIONED),
+                )
+            )
         return queryset
 
     def perform_destroy(self, instance):
@@ -88,7 +108,11 @@ class ServiceRequirementsViewSet(
 
     @cached_property
     def service(self):
-        return get_object_or_404(Service, pk=self.kwargs["service_pk"])
+        # The project and consortium are used by the permissions
+        return get_object_or_404(
+            Service.objects.select_related("project__consortium"),
+            pk=self.kwargs["service_pk"],
+        )
 
     def get_serializer_context(self):
         context = super().get_serializer_context()